@@ -0,0 +1,46 @@
+import argparse
+
+from benchmarks.utils import measure, print_results
+from data.generators import generate_multipolygon
+from projects_manager.domain.projects.geometry import validate_multipolygon
+
+
+def legacy_validate_coordinates(coordinates):
+    # The structural walk AreaOfInterest.validate_geometry used before the
+    # NumPy engine; it checked nothing but nesting and ring length.
+    if not all(
+        isinstance(polygon, list)
+        and all(isinstance(area, list) and len(area) >= 4 for area in polygon)
+        for polygon in coordinates
+    ):
+        raise ValueError("Invalid 'MultiPolygon' structure.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the legacy structural walk with the NumPy validator."
+    )
+    parser.add_argument(
+        "--vertices",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1_000, 10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    for vertex_count in args.vertices:
+        coordinates = generate_multipolygon(vertex_count)["geometry"]["coordinates"]
+        repeat = max(3, args.repeat if vertex_count < 100_000 else args.repeat // 3)
+        results[f"legacy walk, {vertex_count} vertices"] = measure(
+            lambda: legacy_validate_coordinates(coordinates), repeat
+        )
+        results[f"numpy engine, {vertex_count} vertices"] = measure(
+            lambda: validate_multipolygon(coordinates), repeat
+        )
+    print_results("AreaOfInterest geometry validation", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from benchmarks.utils import (
+    bench_client,
+    create_bench_database,
+    measure,
+    print_results,
+    seed_projects,
+)
+from data.samples import SAMPLE_GEOJSON
+from projects_manager.domain.common.pagination import encode_cursor
+from projects_manager.domain.projects.models import Project
+
+PAGE_SIZE = 50
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare page-number and cursor pagination at increasing depths."
+    )
+    parser.add_argument("--projects", type=int, default=50_000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_bench_database()
+    created_at = datetime(2025, 1, 1)
+    seed_projects(
+        engine,
+        (
+            {
+                "name": f"bench-{index}",
+                "start_date": date(2025, 1, 1),
+                "end_date": date(2025, 1, 1) + timedelta(days=30),
+                "area_of_interest": SAMPLE_GEOJSON,
+                "created_at": created_at + timedelta(seconds=index),
+                "updated_at": created_at + timedelta(seconds=index),
+            }
+            for index in range(args.projects)
+        ),
+    )
+
+    cursors: Dict[int, str | None] = {}
+    with Session(engine) as session:
+        for depth in args.depths:
+            if depth == 1:
+                cursors[depth] = None
+                continue
+            previous = session.scalar(
+                select(Project)
+                .order_by(Project.created_at, Project.id)
+                .offset((depth - 1) * PAGE_SIZE - 1)
+                .limit(1)
+            )
+            cursors[depth] = encode_cursor(previous) if previous else None
+
+    results = {}
+    with bench_client() as client:
+        for depth in args.depths:
+            results[f"page number, page {depth}"] = measure(
+                lambda: client.get(
+                    "/api/projects/list", params={"page": depth, "size": PAGE_SIZE}
+                ),
+                args.repeat,
+            )
+            cursor_params = {"size": PAGE_SIZE}
+            if cursors[depth]:
+                cursor_params["cursor"] = cursors[depth]
+            results[f"cursor, page {depth}"] = measure(
+                lambda: client.get("/api/projects/list/cursor", params=cursor_params),
+                args.repeat,
+            )
+    engine.dispose()
+    print_results(f"/list pagination over {args.projects} projects", results)
+
+
+if __name__ == "__main__":
+    main()
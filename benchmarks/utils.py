@@ -0,0 +1,109 @@
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+import psycopg2
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from main import get_application
+from projects_manager.config.dependencies import get_sessionmaker
+from projects_manager.config.settings import get_settings
+from projects_manager.domain.common.models import Base
+from projects_manager.domain.projects.models import Project
+from projects_manager.domain.projects.storage import area_of_interest_columns
+
+BENCH_DATABASE_NAME: str = f"{get_settings().db_name}_bench_db"
+BENCH_DATABASE_URL: str = (
+    f"{get_settings().database_url.rsplit('/', 1)[0]}/{BENCH_DATABASE_NAME}"
+)
+BENCH_ASYNC_DATABASE_URL: str = (
+    f"{get_settings().async_database_url.rsplit('/', 1)[0]}/{BENCH_DATABASE_NAME}"
+)
+
+
+def create_bench_database() -> Engine:
+    connection = psycopg2.connect(get_settings().database_url, sslmode="disable")
+    connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS {BENCH_DATABASE_NAME};")
+            cursor.execute(f"CREATE DATABASE {BENCH_DATABASE_NAME};")
+    finally:
+        connection.close()
+
+    engine = create_engine(BENCH_DATABASE_URL)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed_projects(
+    engine: Engine, rows: Iterable[Dict[str, Any]], batch_size: int = 1000
+):
+    batch: List[Dict[str, Any]] = []
+    with engine.begin() as connection:
+        for row in rows:
+            if "area_of_interest" in row:
+                row.update(
+                    area_of_interest_columns(
+                        row.pop("area_of_interest"), get_settings().geometry_storage
+                    )
+                )
+            batch.append(row)
+            if len(batch) == batch_size:
+                connection.execute(insert(Project), batch)
+                batch = []
+        if batch:
+            connection.execute(insert(Project), batch)
+        connection.execute(text("ANALYZE projects"))
+
+
+@contextmanager
+def bench_client() -> Iterator[TestClient]:
+    engine = create_async_engine(BENCH_ASYNC_DATABASE_URL, poolclass=NullPool)
+    session_factory = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+
+    application = get_application()
+    application.dependency_overrides[get_sessionmaker] = lambda: session_factory
+    with TestClient(application) as client:
+        yield client
+
+
+def measure(operation: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - started) * 1000)
+    return summarize(timings)
+
+
+def summarize(timings_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings_ms)
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1],
+    }
+
+
+def print_results(title: str, results: Dict[str, Dict[str, float]]):
+    print(title)
+    print(f"{'case':<32}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for case, summary in results.items():
+        print(
+            f"{case:<32}{summary['p50_ms']:>10.2f}"
+            f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}"
+        )
@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from typing import Dict, List
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from benchmarks.utils import (
+    BENCH_ASYNC_DATABASE_URL,
+    create_bench_database,
+    print_results,
+    summarize,
+)
+from data.generators import generate_multipolygon
+from main import get_application
+from projects_manager.config.dependencies import get_sessionmaker
+from projects_manager.config.settings import get_settings
+from projects_manager.routers.projects import validation_pool
+
+
+def project_payload(name: str, vertex_count: int) -> bytes:
+    return json.dumps(
+        {
+            "name": name,
+            "start_date": date(2025, 1, 1).isoformat(),
+            "end_date": (date(2025, 1, 1) + timedelta(days=30)).isoformat(),
+            "area_of_interest": generate_multipolygon(vertex_count, seed=hash(name)),
+        }
+    ).encode()
+
+
+async def run_case(
+    client: httpx.AsyncClient,
+    case: str,
+    small_body: bytes,
+    large_bodies: List[bytes],
+    concurrency: int,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    uploads_done = asyncio.Event()
+
+    async def upload(bodies: List[bytes]):
+        for body in bodies:
+            response = await client.post("/api/projects/create", content=body)
+            response.raise_for_status()
+
+    async def probe():
+        index = 0
+        while not uploads_done.is_set():
+            body = small_body.replace(b"small", f"small-{case}-{index}".encode(), 1)
+            started = time.perf_counter()
+            response = await client.post("/api/projects/create", content=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+            index += 1
+            await asyncio.sleep(0.005)
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.gather(
+        *(upload(large_bodies[worker::concurrency]) for worker in range(concurrency))
+    )
+    uploads_done.set()
+    await probe_task
+    return summarize(latencies)
+
+
+async def main_async(args: argparse.Namespace):
+    create_bench_database().dispose()
+    engine = create_async_engine(BENCH_ASYNC_DATABASE_URL, poolclass=NullPool)
+    session_factory = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+    application = get_application()
+    application.dependency_overrides[get_sessionmaker] = lambda: session_factory
+
+    small_body = project_payload("small", 10)
+    results = {}
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for case, threshold in (
+            ("inline", 1 << 62),
+            ("offloaded", get_settings().validation_offload_threshold),
+        ):
+            get_settings().validation_offload_threshold = threshold
+            large_bodies = [
+                project_payload(f"{case}-{index}", args.vertices)
+                for index in range(args.uploads)
+            ]
+            # Start the pool outside the measurement.
+            await client.post("/api/projects/create", content=large_bodies[0])
+            results[f"small create, {case}"] = await run_case(
+                client, case, small_body, large_bodies[1:], args.concurrency
+            )
+    validation_pool.shutdown()
+    await engine.dispose()
+    print_results(
+        f"Small /create latency during {args.vertices}-vertex uploads "
+        f"({args.concurrency} concurrent)",
+        results,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure small-request latency while large uploads are validated."
+    )
+    parser.add_argument("--vertices", type=int, default=200_000)
+    parser.add_argument("--uploads", type=int, default=9)
+    parser.add_argument("--concurrency", type=int, default=2)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,21 +4,25 @@ from contextlib import contextmanager
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from data.samples import SAMPLE_GEOJSON
 from main import get_application
-from projects_manager.config.dependencies import get_db
+from projects_manager.config.dependencies import get_sessionmaker
 from projects_manager.config.settings import get_settings
 from projects_manager.domain.common.models import Base
 from projects_manager.domain.projects.models import Project
 
-
 ADMIN_DATABASE_URL: str = get_settings().database_url
 TEST_DATABASE_NAME: str = f"{get_settings().db_name}_test_db"
 TEST_DATABASE_URL: str = (
     f"{get_settings().database_url.rsplit('/', 1)[0]}/{TEST_DATABASE_NAME}"
 )
+TEST_ASYNC_DATABASE_URL: str = (
+    f"{get_settings().async_database_url.rsplit('/', 1)[0]}/{TEST_DATABASE_NAME}"
+)
 
 
 @contextmanager
@@ -69,21 +73,29 @@ def test_db(test_engine):
         db.close()
 
 
-@pytest.fixture(scope="function")
-def override_get_db(test_db):
-    def _override_get_db():
-        try:
-            yield test_db
-        finally:
-            test_db.close()
+@pytest.fixture(scope="session")
+def test_async_engine(test_engine):
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+    yield engine
+    engine.sync_engine.dispose()
 
-    return _override_get_db
+
+@pytest.fixture(scope="session")
+def test_async_sessionmaker(test_async_engine):
+    return async_sessionmaker(
+        bind=test_async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+@pytest.fixture(scope="session")
+def test_database_url(test_engine) -> str:
+    return TEST_DATABASE_URL
 
 
 @pytest.fixture(scope="function")
-def client(override_get_db):
+def client(test_async_sessionmaker):
     app = get_application()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sessionmaker] = lambda: test_async_sessionmaker
     return TestClient(app)
 
 
@@ -0,0 +1,60 @@
+import math
+import random
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_CENTER = (-52.76, -5.6)
+
+
+def generate_ring(
+    vertex_count: int,
+    center: Tuple[float, float] = DEFAULT_CENTER,
+    radius: float = 0.05,
+    seed: int = 0,
+) -> List[List[float]]:
+    # Star-shaped around ``center``: sorted angles with positive radii never
+    # self-intersect, whatever the vertex count. The radius follows a smooth
+    # wobble plus jitter on the scale of the vertex spacing, like a surveyed
+    # boundary rather than a spiky star.
+    rng = random.Random(seed)
+    points = max(vertex_count - 1, 3)
+    step = 2 * math.pi / points
+    ring = []
+    for index in range(points):
+        angle = (index + rng.uniform(0.1, 0.9)) * step
+        distance = radius * (
+            0.85 + 0.1 * math.sin(5 * angle) + rng.uniform(-0.5, 0.5) * min(step, 0.1)
+        )
+        ring.append(
+            [
+                center[0] + distance * math.cos(angle),
+                center[1] + distance * math.sin(angle),
+            ]
+        )
+    ring.append(list(ring[0]))
+    return ring
+
+
+def generate_multipolygon(
+    vertex_count: int,
+    polygon_count: int = 1,
+    center: Tuple[float, float] = DEFAULT_CENTER,
+    radius: float = 0.05,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    per_polygon = max(vertex_count // polygon_count, 4)
+    polygons = [
+        [
+            generate_ring(
+                per_polygon,
+                center=(center[0] + index * 3 * radius, center[1]),
+                radius=radius,
+                seed=seed + index,
+            )
+        ]
+        for index in range(polygon_count)
+    ]
+    return {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {"type": "MultiPolygon", "coordinates": polygons},
+    }
@@ -1,16 +1,34 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 
 from projects_manager.config.db import engine, SessionLocal
+from projects_manager.config.invalidation import CacheInvalidationListener
 from projects_manager.config.settings import get_settings
 from projects_manager.domain.common.models import Base
 from projects_manager.handlers import http_error_handler
 from projects_manager.routers.api import router as api_router
+from projects_manager.routers.projects import cache, validation_pool
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    listener = None
+    if get_settings().cache_invalidation_enabled:
+        listener = CacheInvalidationListener(get_settings().database_url, cache)
+        await listener.start()
+    try:
+        yield
+    finally:
+        if listener is not None:
+            await listener.stop()
+        validation_pool.shutdown()
 
 
 def get_application() -> FastAPI:
-    application = FastAPI()
+    application = FastAPI(lifespan=lifespan)
     Base.metadata.create_all(bind=engine)
     application.include_router(api_router)
     application.add_exception_handler(Exception, http_error_handler)
@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator, List, TextIO
+
+import anyio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from projects_manager.config.db import AsyncSessionLocal
+from projects_manager.config.settings import GeometryStorage, get_settings
+from projects_manager.domain.projects.importer import (
+    GeoJSONStreamError,
+    import_feature_collection,
+)
+from projects_manager.domain.projects.services import convert_geometry_storage
+
+FILE_CHUNK_SIZE = 1024 * 1024
+
+
+async def _read_chunks(path: str) -> AsyncIterator[bytes]:
+    async with await anyio.open_file(path, "rb") as file:
+        while chunk := await file.read(FILE_CHUNK_SIZE):
+            yield chunk
+
+
+async def import_geojson(
+    path: str,
+    batch_size: int,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    output: TextIO = sys.stdout,
+) -> int:
+    failed = 0
+    async with session_factory() as db:
+        async for result in import_feature_collection(
+            db, _read_chunks(path), batch_size
+        ):
+            for item in result.items:
+                output.write(item.model_dump_json() + "\n")
+            failed += result.failed
+    return failed
+
+
+async def migrate_geometry(
+    storage: GeometryStorage,
+    batch_size: int,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    output: TextIO = sys.stdout,
+) -> int:
+    total = 0
+    async with session_factory() as db:
+        async for converted in convert_geometry_storage(db, storage, batch_size):
+            total += converted
+            output.write(f"Converted {total} projects to {storage.value} storage\n")
+    return total
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m projects_manager.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser(
+        "import-geojson",
+        help="Import a GeoJSON FeatureCollection, printing one NDJSON report line per feature.",
+    )
+    import_parser.add_argument("path")
+    import_parser.add_argument(
+        "--batch-size", type=int, default=get_settings().import_batch_size
+    )
+    migrate_parser = commands.add_parser(
+        "migrate-geometry",
+        help="Rewrite stored areas of interest in the given geometry storage format.",
+    )
+    migrate_parser.add_argument(
+        "storage",
+        type=GeometryStorage,
+        choices=list(GeometryStorage),
+        metavar="{json,binary}",
+    )
+    migrate_parser.add_argument(
+        "--batch-size", type=int, default=get_settings().import_batch_size
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate-geometry":
+        asyncio.run(migrate_geometry(args.storage, args.batch_size))
+        return 0
+
+    try:
+        failed = asyncio.run(import_geojson(args.path, args.batch_size))
+    except GeoJSONStreamError as exc:
+        print(f"Invalid GeoJSON: {exc}", file=sys.stderr)
+        return 2
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,141 @@
+import asyncio
+import sys
 import time
-from typing import Any, Optional, Dict
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
 from threading import Lock
 
+from pydantic import BaseModel
+
+
+def deep_getsizeof(value: Any) -> int:
+    size = 0
+    stack = [value]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, BaseModel):
+            stack.append(item.__dict__)
+    return size
+
 
 class InMemoryCache:
-    def __init__(self, expiration_time: int = 300):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        expiration_time: int = 300,
+        max_entries: int = 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+        sizeof: Callable[[Any], int] = deep_getsizeof,
+    ):
+        self.cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self.expiration_time = expiration_time
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.loads = 0
+        self.invalidations = 0
         self.lock = Lock()
+        self._loading: Dict[str, asyncio.Future] = {}
 
     def get(self, key: str) -> Any:
         with self.lock:
             entry = self.cache.get(key)
             if entry and (time.time() - entry["timestamp"] < self.expiration_time):
+                self.cache.move_to_end(key)
+                self.hits += 1
                 return entry["value"]
             elif entry:
-                del self.cache[key]
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
             return None
 
     def set(self, key: str, value: Any):
+        size = self.sizeof(value)
         with self.lock:
-            self.cache[key] = {"value": value, "timestamp": time.time()}
+            if key in self.cache:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self.cache[key] = {"value": value, "timestamp": time.time(), "size": size}
+            self.size_bytes += size
+            while (
+                len(self.cache) > self.max_entries or self.size_bytes > self.max_bytes
+            ):
+                _, evicted = self.cache.popitem(last=False)
+                self.size_bytes -= evicted["size"]
+                self.evictions += 1
 
     def clear(self, key: Optional[str] = None):
         with self.lock:
+            self.invalidations += 1
             if key:
-                self.cache.pop(key, None)
+                self._remove(key)
             else:
                 self.cache.clear()
+                self.size_bytes = 0
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        while (pending := self._loading.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        invalidations = self.invalidations
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        finally:
+            self._loading.pop(key, None)
+
+        self.loads += 1
+        if self.invalidations == invalidations:
+            self.set(key, value)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                "entries": len(self.cache),
+                "size_bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: str):
+        entry = self.cache.pop(key, None)
+        if entry:
+            self.size_bytes -= entry["size"]
@@ -1,9 +1,63 @@
-from projects_manager.config.db import SessionLocal
+from typing import Any, AsyncIterator, Dict, Type
 
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-def get_db():
-    db = SessionLocal()
-    try:
+from projects_manager.config.db import AsyncSessionLocal
+from projects_manager.config.settings import get_settings
+from pydantic import BaseModel
+
+from projects_manager.config.workers import WorkerPool, validate_json_body
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return AsyncSessionLocal
+
+
+async def get_db(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
+) -> AsyncIterator[AsyncSession]:
+    async with session_factory() as db:
         yield db
-    finally:
-        db.close()
+
+
+class ValidatedBody:
+    def __init__(self, schema: Type[BaseModel], pool: WorkerPool, **dump_options):
+        self.schema = schema
+        self.pool = pool
+        self.dump_options = dump_options
+
+    async def __call__(self, request: Request) -> Dict[str, Any]:
+        body = await request.body()
+        # Small bodies are cheaper to validate inline than to ship to a worker.
+        if len(body) > get_settings().validation_offload_threshold:
+            data, errors = await self.pool.run(
+                validate_json_body, self.schema, body, self.dump_options
+            )
+        else:
+            data, errors = validate_json_body(self.schema, body, self.dump_options)
+        if errors:
+            raise RequestValidationError(errors)
+        return data
+
+    @property
+    def openapi_extra(self) -> Dict[str, Any]:
+        schema = self.schema.model_json_schema()
+        definitions = schema.pop("$defs", {})
+
+        def inline(node: Any) -> Any:
+            if isinstance(node, dict):
+                if "$ref" in node:
+                    return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+                return {key: inline(value) for key, value in node.items()}
+            if isinstance(node, list):
+                return [inline(value) for value in node]
+            return node
+
+        return {
+            "requestBody": {
+                "required": True,
+                "content": {"application/json": {"schema": inline(schema)}},
+            }
+        }
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import logging
+from typing import Iterable, List
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from projects_manager.config.cache import InMemoryCache
+
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+logger = logging.getLogger(__name__)
+
+
+def _chunk_keys(keys: Iterable[str]) -> Iterable[List[str]]:
+    chunk: List[str] = []
+    chunk_size = 2
+    for key in keys:
+        key_size = len(json.dumps(key)) + 1
+        if chunk and chunk_size + key_size > MAX_NOTIFY_PAYLOAD_BYTES:
+            yield chunk
+            chunk, chunk_size = [], 2
+        chunk.append(key)
+        chunk_size += key_size
+    if chunk:
+        yield chunk
+
+
+async def publish_invalidation(db: AsyncSession, keys: Iterable[str]):
+    # NOTIFY is transactional: listeners only hear about it once ``db`` commits.
+    for chunk in _chunk_keys(keys):
+        await db.execute(
+            select(
+                func.pg_notify(
+                    CACHE_INVALIDATION_CHANNEL, json.dumps(chunk, separators=(",", ":"))
+                )
+            )
+        )
+
+
+class CacheInvalidationListener:
+    def __init__(
+        self,
+        dsn: str,
+        cache: InMemoryCache,
+        channel: str = CACHE_INVALIDATION_CHANNEL,
+        reconnect_delay: float = 1.0,
+    ):
+        self.dsn = dsn
+        self.cache = cache
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.connection: asyncpg.Connection | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopped = False
+
+    async def start(self):
+        self._stopped = False
+        self.connection = await asyncpg.connect(self.dsn)
+        await self.connection.add_listener(self.channel, self._on_notification)
+        self.connection.add_termination_listener(self._on_termination)
+
+    async def stop(self):
+        self._stopped = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self.connection and not self.connection.is_closed():
+            await self.connection.close()
+        self.connection = None
+
+    def _on_notification(self, _connection, _pid, _channel, payload: str):
+        try:
+            keys = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation: %r", payload)
+            return
+        for key in keys:
+            self.cache.clear(key)
+
+    def _on_termination(self, _connection):
+        # Anything published while disconnected is lost, so drop the whole cache.
+        self.cache.clear()
+        if not self._stopped:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self):
+        while not self._stopped:
+            try:
+                await self.start()
+                self.cache.clear()
+                return
+            except (OSError, asyncpg.PostgresError):
+                logger.warning("Cache invalidation listener reconnect failed")
+                await asyncio.sleep(self.reconnect_delay)
@@ -1,6 +1,14 @@
+from enum import Enum
 from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from projects_manager.config.workers import WorkerPoolKind
+
+
+class GeometryStorage(str, Enum):
+    JSON = "json"
+    BINARY = "binary"
+
 
 class Settings(BaseSettings):
     allowed_hosts: str
@@ -9,6 +17,17 @@ class Settings(BaseSettings):
     db_password: str
     db_host: str
     db_port: int
+    cache_expiration_time: int = 3600
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_invalidation_enabled: bool = True
+    batch_max_size: int = 1000
+    export_chunk_size: int = 500
+    import_batch_size: int = 500
+    validation_offload_threshold: int = 256 * 1024
+    validation_pool_kind: WorkerPoolKind = WorkerPoolKind.PROCESS
+    validation_pool_size: int = 2
+    geometry_storage: GeometryStorage = GeometryStorage.JSON
 
     model_config = SettingsConfigDict(
         env_file="projects_manager/config/.env", env_file_encoding="utf-8"
@@ -18,6 +37,10 @@ class Settings(BaseSettings):
     def database_url(self):
         return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{int(self.db_port)}/{self.db_name}"
 
+    @property
+    def async_database_url(self):
+        return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{int(self.db_port)}/{self.db_name}"
+
 
 @lru_cache
 def get_settings():
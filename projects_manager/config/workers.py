@@ -0,0 +1,66 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+ResultT = TypeVar("ResultT")
+
+
+class WorkerPoolKind(str, Enum):
+    PROCESS = "process"
+    THREAD = "thread"
+
+
+class WorkerPool:
+    def __init__(self, kind: WorkerPoolKind, max_workers: int):
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._lock = Lock()
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind is WorkerPoolKind.PROCESS:
+                    # Forking a process that runs an event loop and holds open
+                    # database connections is unsafe, so workers are spawned.
+                    self._executor = ProcessPoolExecutor(
+                        self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="worker-pool"
+                    )
+            return self._executor
+
+    async def run(self, function: Callable[..., ResultT], *args: Any) -> ResultT:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, function, *args
+        )
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def validate_json_body(
+    schema: Type[BaseModel], body: bytes, dump_options: Dict[str, Any]
+) -> Tuple[Dict[str, Any] | None, List[Dict[str, Any]]]:
+    # Dumping happens here too, so the caller only receives plain data.
+    try:
+        return schema.model_validate_json(body).model_dump(**dump_options), []
+    except ValidationError as exc:
+        # Errors go back as plain data; a ValidationError cannot cross a
+        # process boundary.
+        return None, [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Sequence, Tuple, Type, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from projects_manager.domain.common.models import Base
+from projects_manager.handlers import ErrorMessages
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+
+def encode_cursor(row: Base) -> str:
+    payload = json.dumps([row.created_at.isoformat(), str(row.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorMessages.INVALID_CURSOR,
+        )
+
+
+async def paginate_by_keyset(
+    db: AsyncSession,
+    model: Type[ModelT],
+    query: Select,
+    cursor: str | None,
+    size: int,
+) -> Tuple[Sequence[ModelT], str | None]:
+    if cursor:
+        query = query.where(
+            tuple_(model.created_at, model.id) > tuple_(*decode_cursor(cursor))
+        )
+    query = query.order_by(model.created_at, model.id).limit(size + 1)
+    rows = (await db.scalars(query)).all()
+    if len(rows) > size:
+        rows = rows[:size]
+        return rows, encode_cursor(rows[-1])
+    return rows, None
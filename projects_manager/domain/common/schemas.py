@@ -1,5 +1,15 @@
+from typing import Generic, List, TypeVar
+
 from pydantic import BaseModel, ConfigDict
 
+ItemT = TypeVar("ItemT")
+
 
 class OrmBaseModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
+
+
+class CursorPage(BaseModel, Generic[ItemT]):
+    items: List[ItemT]
+    size: int
+    next_cursor: str | None = None
@@ -0,0 +1,78 @@
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from projects_manager.domain.projects.models import Project
+from projects_manager.domain.projects.storage import decode_area_of_interest
+
+
+class ExportFormat(str, Enum):
+    GEOJSON = "geojson"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        if self is ExportFormat.NDJSON:
+            return "application/x-ndjson"
+        return "application/geo+json"
+
+
+def project_to_feature(row: Row) -> Dict[str, Any]:
+    area_of_interest = decode_area_of_interest(
+        row.area_of_interest_json, row.area_of_interest_wkb
+    )
+    return {
+        "type": "Feature",
+        "id": str(row.id),
+        "geometry": area_of_interest["geometry"],
+        "properties": {
+            **area_of_interest.get("properties", {}),
+            "name": row.name,
+            "description": row.description,
+            "start_date": row.start_date.isoformat(),
+            "end_date": row.end_date.isoformat(),
+        },
+    }
+
+
+async def stream_projects(
+    session_factory: async_sessionmaker[AsyncSession],
+    export_format: ExportFormat,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    separator = "\n" if export_format is ExportFormat.NDJSON else ","
+    if export_format is ExportFormat.GEOJSON:
+        yield b'{"type":"FeatureCollection","features":['
+
+    first_chunk = True
+    async with session_factory() as db:
+        result = await db.stream(
+            select(
+                Project.id,
+                Project.name,
+                Project.description,
+                Project.start_date,
+                Project.end_date,
+                Project.area_of_interest_json,
+                Project.area_of_interest_wkb,
+            )
+            .order_by(Project.created_at, Project.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions():
+            chunk = separator.join(
+                json.dumps(project_to_feature(row), separators=(",", ":"))
+                for row in partition
+            )
+            if export_format is ExportFormat.NDJSON:
+                chunk += "\n"
+            elif not first_chunk:
+                chunk = separator + chunk
+            first_chunk = False
+            yield chunk.encode()
+
+    if export_format is ExportFormat.GEOJSON:
+        yield b"]}"
@@ -0,0 +1,337 @@
+import struct
+from typing import Any, Iterator, List, NamedTuple
+
+import numpy as np
+
+MIN_RING_POSITIONS = 4
+PAIR_CHUNK_SIZE = 1_000_000
+MAX_CANDIDATE_PAIRS = 200_000_000
+MAX_GRID_CELLS = 1 << 20
+WKB_LITTLE_ENDIAN = 1
+WKB_POLYGON = 3
+WKB_MULTIPOLYGON = 6
+
+
+class GeometryError(ValueError):
+    pass
+
+
+class MultiPolygonArrays(NamedTuple):
+    # Positions of every ring, back to back, as an (n, 2) float64 lon/lat array.
+    coordinates: np.ndarray
+    # coordinates[ring_offsets[r]:ring_offsets[r + 1]] is ring r.
+    ring_offsets: np.ndarray
+    # ring_offsets[polygon_offsets[p]:polygon_offsets[p + 1]] are the rings of polygon p.
+    polygon_offsets: np.ndarray
+
+    @property
+    def ring_starts(self) -> np.ndarray:
+        return self.ring_offsets[:-1]
+
+    @property
+    def ring_ends(self) -> np.ndarray:
+        return self.ring_offsets[1:]
+
+    @property
+    def ring_polygons(self) -> np.ndarray:
+        return np.repeat(
+            np.arange(len(self.polygon_offsets) - 1), np.diff(self.polygon_offsets)
+        )
+
+
+def multipolygon_to_arrays(
+    coordinates: Any, allow_altitude: bool = True
+) -> MultiPolygonArrays:
+    if not isinstance(coordinates, list) or not coordinates:
+        raise GeometryError("geometry must contain a non-empty 'coordinates' list")
+
+    rings: List[np.ndarray] = []
+    polygon_offsets = [0]
+    for polygon in coordinates:
+        if not isinstance(polygon, list) or not polygon:
+            raise GeometryError(
+                "Invalid 'MultiPolygon' structure. Each polygon must contain at least one area with 4+ points."
+            )
+        for ring in polygon:
+            if not isinstance(ring, list) or len(ring) < MIN_RING_POSITIONS:
+                raise GeometryError(
+                    "Invalid 'MultiPolygon' structure. Each polygon must contain at least one area with 4+ points."
+                )
+            rings.append(_ring_to_array(ring, allow_altitude))
+        polygon_offsets.append(len(rings))
+
+    ring_offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum([len(ring) for ring in rings], out=ring_offsets[1:])
+    return MultiPolygonArrays(
+        coordinates=np.ascontiguousarray(np.concatenate(rings), dtype=np.float64),
+        ring_offsets=ring_offsets,
+        polygon_offsets=np.asarray(polygon_offsets, dtype=np.int64),
+    )
+
+
+def _ring_to_array(ring: List[Any], allow_altitude: bool) -> np.ndarray:
+    try:
+        positions = np.asarray(ring)
+    except ValueError:
+        raise GeometryError("Every position must be a [longitude, latitude] pair")
+    if (
+        positions.ndim != 2
+        or positions.shape[1] not in ((2, 3) if allow_altitude else (2,))
+        or positions.dtype.kind not in "iuf"
+    ):
+        raise GeometryError("Every position must be a [longitude, latitude] pair")
+    return positions[:, :2].astype(np.float64, copy=False)
+
+
+def arrays_to_coordinates(arrays: MultiPolygonArrays) -> List[Any]:
+    positions = arrays.coordinates.tolist()
+    rings = [
+        positions[start:end]
+        for start, end in zip(arrays.ring_starts.tolist(), arrays.ring_ends.tolist())
+    ]
+    offsets = arrays.polygon_offsets.tolist()
+    return [rings[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def arrays_to_wkb(arrays: MultiPolygonArrays) -> bytes:
+    # OGC WKB, little-endian: coordinates are stored as packed float64 pairs.
+    coordinates = arrays.coordinates.astype("<f8", copy=False)
+    ring_starts = arrays.ring_starts.tolist()
+    ring_ends = arrays.ring_ends.tolist()
+    polygon_offsets = arrays.polygon_offsets.tolist()
+    parts = [
+        struct.pack(
+            "<BII", WKB_LITTLE_ENDIAN, WKB_MULTIPOLYGON, len(polygon_offsets) - 1
+        )
+    ]
+    for first_ring, last_ring in zip(polygon_offsets[:-1], polygon_offsets[1:]):
+        parts.append(
+            struct.pack("<BII", WKB_LITTLE_ENDIAN, WKB_POLYGON, last_ring - first_ring)
+        )
+        for ring in range(first_ring, last_ring):
+            parts.append(struct.pack("<I", ring_ends[ring] - ring_starts[ring]))
+            parts.append(coordinates[ring_starts[ring] : ring_ends[ring]].tobytes())
+    return b"".join(parts)
+
+
+def wkb_to_arrays(data: bytes) -> MultiPolygonArrays:
+    def read_header(offset: int, expected_type: int):
+        byte_order, geometry_type, count = struct.unpack_from("<BII", data, offset)
+        if byte_order != WKB_LITTLE_ENDIAN or geometry_type != expected_type:
+            raise GeometryError("Unsupported WKB geometry")
+        return count, offset + 9
+
+    polygon_count, offset = read_header(0, WKB_MULTIPOLYGON)
+    rings: List[np.ndarray] = []
+    polygon_offsets = [0]
+    for _ in range(polygon_count):
+        ring_count, offset = read_header(offset, WKB_POLYGON)
+        for _ in range(ring_count):
+            (position_count,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            rings.append(
+                np.frombuffer(data, "<f8", 2 * position_count, offset).reshape(-1, 2)
+            )
+            offset += 16 * position_count
+        polygon_offsets.append(len(rings))
+
+    ring_offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum([len(ring) for ring in rings], out=ring_offsets[1:])
+    return MultiPolygonArrays(
+        coordinates=np.concatenate(rings) if rings else np.empty((0, 2)),
+        ring_offsets=ring_offsets,
+        polygon_offsets=np.asarray(polygon_offsets, dtype=np.int64),
+    )
+
+
+def validate_multipolygon(coordinates: Any) -> MultiPolygonArrays:
+    arrays = multipolygon_to_arrays(coordinates)
+    check_bounds(arrays)
+    check_closed(arrays)
+    check_orientation(arrays)
+    check_self_intersections(arrays)
+    return arrays
+
+
+def check_bounds(arrays: MultiPolygonArrays):
+    longitudes, latitudes = arrays.coordinates[:, 0], arrays.coordinates[:, 1]
+    if not np.isfinite(arrays.coordinates).all():
+        raise GeometryError("Coordinates must be finite numbers")
+    if (np.abs(longitudes) > 180).any() or (np.abs(latitudes) > 90).any():
+        raise GeometryError(
+            "Coordinates must be within longitude [-180, 180] and latitude [-90, 90]"
+        )
+
+
+def check_closed(arrays: MultiPolygonArrays):
+    first = arrays.coordinates[arrays.ring_starts]
+    last = arrays.coordinates[arrays.ring_ends - 1]
+    if (first != last).any():
+        raise GeometryError(
+            "Every ring must be closed: first and last positions differ"
+        )
+
+
+def ring_signed_areas(arrays: MultiPolygonArrays) -> np.ndarray:
+    # Shoelace formula; rings are closed, so the last position pairs with itself.
+    x, y = arrays.coordinates[:-1, 0], arrays.coordinates[:-1, 1]
+    x_next, y_next = arrays.coordinates[1:, 0], arrays.coordinates[1:, 1]
+    cross = np.append(x * y_next - x_next * y, 0.0)
+    cross[arrays.ring_ends - 1] = 0.0
+    return np.add.reduceat(cross, arrays.ring_starts) / 2.0
+
+
+def check_orientation(arrays: MultiPolygonArrays):
+    # RFC 7946 asks parsers not to reject rings by winding order, so only
+    # rings enclosing no area are invalid.
+    if (ring_signed_areas(arrays) == 0.0).any():
+        raise GeometryError("Rings must enclose a non-zero area")
+
+
+def _segments(arrays: MultiPolygonArrays):
+    coordinates = arrays.coordinates
+    ring_ids = np.repeat(
+        np.arange(len(arrays.ring_starts)), np.diff(arrays.ring_offsets)
+    )
+    # A segment starts at every position but the last one of its ring;
+    # repeated positions produce zero-length segments that are skipped.
+    starts = np.ones(len(coordinates), dtype=bool)
+    starts[arrays.ring_ends - 1] = False
+    starts[:-1] &= (coordinates[:-1] != coordinates[1:]).any(axis=1)
+    start_indices = np.flatnonzero(starts)
+
+    segment_rings = ring_ids[start_indices]
+    ring_segment_counts = np.bincount(segment_rings, minlength=len(arrays.ring_starts))
+    first_segment = np.zeros(len(ring_segment_counts) + 1, dtype=np.int64)
+    np.cumsum(ring_segment_counts, out=first_segment[1:])
+
+    return (
+        coordinates[start_indices],
+        coordinates[start_indices + 1],
+        segment_rings,
+        np.arange(len(start_indices)) - first_segment[segment_rings],
+        ring_segment_counts[segment_rings],
+    )
+
+
+def _candidate_pairs(starts: np.ndarray, ends: np.ndarray) -> Iterator[np.ndarray]:
+    # Bucket segment bounding boxes into a uniform grid and pair segments
+    # sharing a cell, instead of testing all n^2 combinations. Cells are sized
+    # to the typical segment so a boundary only meets a few neighbours per
+    # cell; pairs are produced in bounded chunks so memory stays flat.
+    lows = np.minimum(starts, ends)
+    highs = np.maximum(starts, ends)
+    extent = highs.max(axis=0) - lows.min(axis=0)
+    lengths = np.abs(ends - starts).max(axis=1)
+    cell_size = max(2 * lengths.mean(), extent.max() / MAX_GRID_CELLS)
+    if cell_size <= 0:
+        cell_size = 1.0
+
+    origin = lows.min(axis=0)
+    low_cells = ((lows - origin) // cell_size).astype(np.int64)
+    high_cells = ((highs - origin) // cell_size).astype(np.int64)
+    spans = high_cells - low_cells + 1
+    cells_per_segment = spans[:, 0] * spans[:, 1]
+    if cells_per_segment.sum() > MAX_CANDIDATE_PAIRS:
+        raise GeometryError("Geometry is too complex to validate")
+
+    segment_ids = np.repeat(np.arange(len(starts)), cells_per_segment)
+    local = np.arange(len(segment_ids)) - np.repeat(
+        np.cumsum(cells_per_segment) - cells_per_segment, cells_per_segment
+    )
+    span_y = spans[segment_ids, 1]
+    cell_x = low_cells[segment_ids, 0] + local // span_y
+    cell_y = low_cells[segment_ids, 1] + local % span_y
+    grid_height = int(high_cells[:, 1].max()) + 1
+    cell_ids = cell_x * grid_height + cell_y
+
+    order = np.lexsort((segment_ids, cell_ids))
+    cell_ids, segment_ids = cell_ids[order], segment_ids[order]
+    group_starts = np.flatnonzero(np.r_[True, cell_ids[1:] != cell_ids[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(cell_ids)])
+    group_pairs = group_sizes * (group_sizes - 1) // 2
+    if group_pairs.sum() > MAX_CANDIDATE_PAIRS:
+        raise GeometryError("Geometry is too complex to validate")
+
+    chunk_ids = np.cumsum(group_pairs) // PAIR_CHUNK_SIZE
+    chunk_bounds = np.flatnonzero(np.r_[True, chunk_ids[1:] != chunk_ids[:-1], True])
+    for first_group, last_group in zip(chunk_bounds[:-1], chunk_bounds[1:]):
+        sizes = group_sizes[first_group:last_group]
+        offset = group_starts[first_group]
+        members = np.arange(offset, offset + sizes.sum())
+        position_in_group = members - np.repeat(
+            group_starts[first_group:last_group], sizes
+        )
+        partners = np.repeat(sizes, sizes) - position_in_group - 1
+        left = np.repeat(members, partners)
+        right = (
+            left
+            + np.arange(len(left))
+            - np.repeat(np.cumsum(partners) - partners, partners)
+            + 1
+        )
+        if len(left):
+            yield np.stack([segment_ids[left], segment_ids[right]], axis=1)
+
+
+def _cross(origin: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a[:, 0] - origin[:, 0]) * (b[:, 1] - origin[:, 1]) - (
+        a[:, 1] - origin[:, 1]
+    ) * (b[:, 0] - origin[:, 0])
+
+
+def _within_box(a: np.ndarray, b: np.ndarray, point: np.ndarray) -> np.ndarray:
+    return (np.minimum(a, b) <= point).all(axis=1) & (point <= np.maximum(a, b)).all(
+        axis=1
+    )
+
+
+def segments_intersect(
+    p1: np.ndarray, p2: np.ndarray, p3: np.ndarray, p4: np.ndarray
+) -> np.ndarray:
+    d1 = _cross(p3, p4, p1)
+    d2 = _cross(p3, p4, p2)
+    d3 = _cross(p1, p2, p3)
+    d4 = _cross(p1, p2, p4)
+    proper = (np.sign(d1) * np.sign(d2) < 0) & (np.sign(d3) * np.sign(d4) < 0)
+    touching = (
+        ((d1 == 0) & _within_box(p3, p4, p1))
+        | ((d2 == 0) & _within_box(p3, p4, p2))
+        | ((d3 == 0) & _within_box(p1, p2, p3))
+        | ((d4 == 0) & _within_box(p1, p2, p4))
+    )
+    return proper | touching
+
+
+def find_self_intersections(
+    arrays: MultiPolygonArrays, first_only: bool = False
+) -> np.ndarray:
+    found = [np.empty((0, 2), dtype=np.int64)]
+    starts, ends, rings, positions, ring_sizes = _segments(arrays)
+    if len(starts) < 2:
+        return found[0]
+
+    ring_polygons = arrays.ring_polygons
+    for pairs in _candidate_pairs(starts, ends):
+        first, second = pairs[:, 0], pairs[:, 1]
+        same_polygon = ring_polygons[rings[first]] == ring_polygons[rings[second]]
+        same_ring = rings[first] == rings[second]
+        gap = np.abs(positions[first] - positions[second])
+        adjacent = same_ring & ((gap == 1) | (gap == ring_sizes[first] - 1))
+        pairs = pairs[same_polygon & ~adjacent]
+
+        first, second = pairs[:, 0], pairs[:, 1]
+        hits = pairs[
+            segments_intersect(starts[first], ends[first], starts[second], ends[second])
+        ]
+        if len(hits):
+            found.append(hits)
+            if first_only:
+                break
+    # Segments spanning several cells can pair up more than once.
+    return np.unique(np.concatenate(found), axis=0)
+
+
+def check_self_intersections(arrays: MultiPolygonArrays):
+    if len(find_self_intersections(arrays, first_only=True)):
+        raise GeometryError("Polygon rings must not intersect or touch each other")
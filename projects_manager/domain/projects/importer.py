@@ -0,0 +1,205 @@
+import codecs
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from projects_manager.domain.projects.schemas import BatchResultSchema
+from projects_manager.domain.projects.services import create_projects
+
+PROJECT_PROPERTIES = ("name", "description", "start_date", "end_date")
+WHITESPACE = " \t\n\r"
+_INCOMPLETE = object()
+
+
+class GeoJSONStreamError(ValueError):
+    pass
+
+
+class _State(Enum):
+    START = "start"
+    KEY = "key"
+    COLON = "colon"
+    VALUE = "value"
+    AFTER_VALUE = "after_value"
+    FEATURE = "feature"
+    AFTER_FEATURE = "after_feature"
+    DONE = "done"
+
+
+class FeatureCollectionParser:
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._state = _State.START
+        self._key = ""
+        self._features_seen = False
+        self._retry_length = 0
+        self._closed = False
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        self._buffer = self._buffer[self._position :] + self._decoder.decode(data)
+        self._position = 0
+        return list(self._parse())
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._buffer = self._buffer[self._position :] + self._decoder.decode(
+            b"", final=True
+        )
+        self._position = 0
+        self._closed = True
+        self._retry_length = 0
+        features = list(self._parse())
+        if self._buffer[self._position :].strip(WHITESPACE):
+            raise GeoJSONStreamError("Unexpected data after FeatureCollection")
+        if self._state is not _State.DONE:
+            raise GeoJSONStreamError("Incomplete FeatureCollection")
+        if not self._features_seen:
+            raise GeoJSONStreamError("FeatureCollection has no 'features' array")
+        return features
+
+    def _parse(self) -> Iterator[Dict[str, Any]]:
+        while self._state is not _State.DONE:
+            character = self._next_character()
+            if character is None:
+                return
+
+            if self._state is _State.START:
+                self._expect(character, "{")
+                self._state = _State.KEY
+            elif self._state is _State.KEY:
+                if character == "}":
+                    self._position += 1
+                    self._state = _State.DONE
+                    continue
+                key = self._decode_value()
+                if key is _INCOMPLETE:
+                    return
+                if not isinstance(key, str):
+                    raise GeoJSONStreamError("Expected an object key")
+                self._key = key
+                self._state = _State.COLON
+            elif self._state is _State.COLON:
+                self._expect(character, ":")
+                self._state = _State.VALUE
+            elif self._state is _State.VALUE:
+                if self._key == "features":
+                    self._expect(character, "[")
+                    self._features_seen = True
+                    self._state = _State.FEATURE
+                    continue
+                value = self._decode_value()
+                if value is _INCOMPLETE:
+                    return
+                if self._key == "type" and value != "FeatureCollection":
+                    raise GeoJSONStreamError("Expected a GeoJSON FeatureCollection")
+                self._state = _State.AFTER_VALUE
+            elif self._state is _State.AFTER_VALUE:
+                self._position += 1
+                if character == ",":
+                    self._state = _State.KEY
+                elif character == "}":
+                    self._state = _State.DONE
+                else:
+                    raise GeoJSONStreamError(f"Unexpected character {character!r}")
+            elif self._state is _State.FEATURE:
+                if character == "]":
+                    self._position += 1
+                    self._state = _State.AFTER_VALUE
+                    continue
+                feature = self._decode_value()
+                if feature is _INCOMPLETE:
+                    return
+                self._state = _State.AFTER_FEATURE
+                yield feature
+            elif self._state is _State.AFTER_FEATURE:
+                self._position += 1
+                if character == ",":
+                    self._state = _State.FEATURE
+                elif character == "]":
+                    self._state = _State.AFTER_VALUE
+                else:
+                    raise GeoJSONStreamError(f"Unexpected character {character!r}")
+
+    def _next_character(self) -> str | None:
+        while self._position < len(self._buffer):
+            character = self._buffer[self._position]
+            if character not in WHITESPACE:
+                return character
+            self._position += 1
+        return None
+
+    def _expect(self, character: str, expected: str):
+        if character != expected:
+            raise GeoJSONStreamError(
+                f"Expected {expected!r} but found {character!r} at offset {self._position}"
+            )
+        self._position += 1
+
+    def _decode_value(self) -> Any:
+        pending = len(self._buffer) - self._position
+        if not self._closed and pending < self._retry_length:
+            return _INCOMPLETE
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError as exc:
+            if self._closed:
+                raise GeoJSONStreamError(str(exc)) from exc
+            # Only retry once the pending data has doubled, keeping large
+            # values linear instead of re-parsing them on every chunk.
+            self._retry_length = 2 * pending
+            return _INCOMPLETE
+        if end == len(self._buffer) and not self._closed:
+            # A number may continue in the next chunk.
+            self._retry_length = pending + 1
+            return _INCOMPLETE
+        self._position = end
+        self._retry_length = 0
+        return value
+
+
+def feature_to_project_payload(feature: Any) -> Dict[str, Any]:
+    if not isinstance(feature, dict):
+        return {"area_of_interest": feature}
+    properties = dict(feature.get("properties") or {})
+    payload = {
+        key: properties.pop(key) for key in PROJECT_PROPERTIES if key in properties
+    }
+    payload["area_of_interest"] = {
+        "type": feature.get("type"),
+        "properties": properties,
+        "geometry": feature.get("geometry"),
+    }
+    return payload
+
+
+async def import_feature_collection(
+    db: AsyncSession, chunks: AsyncIterator[bytes], batch_size: int
+) -> AsyncIterator[BatchResultSchema]:
+    parser = FeatureCollectionParser()
+    batch: List[Tuple[int, Dict[str, Any]]] = []
+    index = 0
+
+    async def write_batch() -> BatchResultSchema:
+        result = await create_projects(db, [payload for _, payload in batch])
+        await db.commit()
+        for item in result.items:
+            item.index = batch[item.index][0]
+        batch.clear()
+        return result
+
+    async for chunk in chunks:
+        for feature in parser.feed(chunk):
+            batch.append((index, feature_to_project_payload(feature)))
+            index += 1
+            if len(batch) >= batch_size:
+                # Awaiting the write before reading further applies backpressure.
+                yield await write_batch()
+    for feature in parser.close():
+        batch.append((index, feature_to_project_payload(feature)))
+        index += 1
+    if batch:
+        yield await write_batch()
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from datetime import date
-from sqlalchemy import CheckConstraint, String, Text, Date, JSON
+from typing import Any, Dict
+
+from sqlalchemy import CheckConstraint, Index, LargeBinary, String, Text, Date, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
+from projects_manager.config.settings import get_settings
 from projects_manager.domain.common.models import Base
+from projects_manager.domain.projects.storage import (
+    decode_area_of_interest,
+    encode_area_of_interest,
+)
 
 
 class Project(Base):
@@ -14,8 +21,28 @@ class Project(Base):
     description: Mapped[str] = mapped_column(Text, nullable=True)
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
-    area_of_interest: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # With binary geometry storage the JSON column keeps the feature without
+    # its coordinates, which live in area_of_interest_wkb.
+    area_of_interest_json: Mapped[dict] = mapped_column(
+        "area_of_interest", JSON, nullable=False
+    )
+    area_of_interest_wkb: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True
+    )
 
     __table_args__ = (
         CheckConstraint("start_date <= end_date", name="check_start_end_date"),
+        Index("ix_projects_created_at_id", "created_at", "id"),
     )
+
+    @property
+    def area_of_interest(self) -> Dict[str, Any]:
+        return decode_area_of_interest(
+            self.area_of_interest_json, self.area_of_interest_wkb
+        )
+
+    @area_of_interest.setter
+    def area_of_interest(self, value: Dict[str, Any]):
+        self.area_of_interest_json, self.area_of_interest_wkb = encode_area_of_interest(
+            value, get_settings().geometry_storage
+        )
@@ -1,10 +1,12 @@
+from enum import Enum
 from uuid import UUID
 from datetime import date
-from typing import Dict, Any
+from typing import Dict, Any, List, Type
 from pydantic import field_validator
 from pydantic import BaseModel, Field
 
 from projects_manager.domain.common.schemas import OrmBaseModel
+from projects_manager.domain.projects.geometry import validate_multipolygon
 
 
 class AreaOfInterest(BaseModel):
@@ -24,15 +26,16 @@ class AreaOfInterest(BaseModel):
         if "coordinates" not in v or not isinstance(v["coordinates"], list):
             raise ValueError("geometry must contain a 'coordinates' list")
 
-        if not all(
-            isinstance(polygon, list)
-            and all(isinstance(area, list) and len(area) >= 4 for area in polygon)
-            for polygon in v["coordinates"]
-        ):
-            raise ValueError(
-                "Invalid 'MultiPolygon' structure. Each polygon must contain at least one area with 4+ points."
-            )
+        validate_multipolygon(v["coordinates"])
+        return v
+
 
+class StoredAreaOfInterest(AreaOfInterest):
+    # Geometries are validated before they are written, so reading them back
+    # skips the geometry engine.
+    @field_validator("geometry", mode="before")
+    @classmethod
+    def validate_geometry(cls, v):
         return v
 
 
@@ -46,6 +49,26 @@ class ProjectBase(BaseModel):
 
 class ProjectDetailsSchema(ProjectBase, OrmBaseModel):
     id: UUID
+    area_of_interest: StoredAreaOfInterest
+
+
+class ProjectSummarySchema(OrmBaseModel):
+    id: UUID
+    name: str
+    description: str | None = None
+    start_date: date
+    end_date: date
+
+
+class ProjectListView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+    @property
+    def schema(self) -> Type[OrmBaseModel]:
+        if self is ProjectListView.SUMMARY:
+            return ProjectSummarySchema
+        return ProjectDetailsSchema
 
 
 class ProjectCreateSchema(ProjectBase):
@@ -79,3 +102,23 @@ class ProjectUpdateSchema(BaseModel):
         ):
             raise ValueError("end_date must be after start_date")
         return v
+
+
+class ProjectBatchUpdateSchema(ProjectUpdateSchema):
+    id: UUID
+
+
+class BatchItemResultSchema(BaseModel):
+    index: int
+    id: UUID | None = None
+    errors: List[str] = []
+
+
+class BatchResultSchema(BaseModel):
+    succeeded: int
+    failed: int
+    items: List[BatchItemResultSchema]
+
+
+class ImportReportSchema(BatchResultSchema):
+    errors: List[str] = []
@@ -1,15 +1,237 @@
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
 from uuid import UUID
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from sqlalchemy import Select, delete, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from projects_manager.config.settings import GeometryStorage, get_settings
 from projects_manager.domain.projects.models import Project
+from projects_manager.domain.projects.schemas import (
+    BatchItemResultSchema,
+    BatchResultSchema,
+    ProjectBatchUpdateSchema,
+    ProjectCreateSchema,
+    ProjectListView,
+)
+from projects_manager.domain.projects.storage import (
+    area_of_interest_columns,
+    decode_area_of_interest,
+)
 from projects_manager.handlers import ErrorMessages
 
 
-async def get_project_by_id(project_id: UUID, db: Session) -> Project:
-    project: Project | None = db.query(Project).filter(Project.id == project_id).first()
+async def get_project_by_id(project_id: UUID, db: AsyncSession) -> Project:
+    project: Project | None = await db.scalar(
+        select(Project).where(Project.id == project_id)
+    )
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessages.PROJECT_NOT_FOUND,
         )
     return project
+
+
+def projects_list_query(view: ProjectListView = ProjectListView.FULL) -> Select:
+    query = select(Project)
+    if view is ProjectListView.SUMMARY:
+        query = query.options(
+            defer(Project.area_of_interest_json, raiseload=True),
+            defer(Project.area_of_interest_wkb, raiseload=True),
+        )
+    return query
+
+
+def _validation_errors(exc: ValidationError) -> List[str]:
+    return [
+        ".".join(str(part) for part in error["loc"]) + f": {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+def _project_columns(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Bulk statements bypass Project.area_of_interest, so encode it here.
+    if "area_of_interest" in data:
+        data.update(
+            area_of_interest_columns(
+                data.pop("area_of_interest"), get_settings().geometry_storage
+            )
+        )
+    return data
+
+
+def _batch_result(items: List[BatchItemResultSchema]) -> BatchResultSchema:
+    failed = sum(1 for item in items if item.errors)
+    return BatchResultSchema(succeeded=len(items) - failed, failed=failed, items=items)
+
+
+async def create_projects(
+    db: AsyncSession, payloads: List[Dict[str, Any]]
+) -> BatchResultSchema:
+    results = [BatchItemResultSchema(index=index) for index in range(len(payloads))]
+    rows: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for index, payload in enumerate(payloads):
+        try:
+            project_data = ProjectCreateSchema.model_validate(payload)
+        except ValidationError as exc:
+            results[index].errors = _validation_errors(exc)
+            continue
+        if project_data.name in rows:
+            results[index].errors = [ErrorMessages.DUPLICATE_IN_BATCH]
+            continue
+        rows[project_data.name] = index, _project_columns(project_data.model_dump())
+
+    if rows:
+        inserted = await db.execute(
+            insert(Project)
+            .on_conflict_do_nothing(index_elements=[Project.name])
+            .returning(Project.id, Project.name),
+            [row for _, row in rows.values()],
+        )
+        created = {name: project_id for project_id, name in inserted.all()}
+        for name, (index, _) in rows.items():
+            if name in created:
+                results[index].id = created[name]
+            else:
+                results[index].errors = [ErrorMessages.PROJECT_NAME_TAKEN]
+
+    return _batch_result(results)
+
+
+async def update_projects(
+    db: AsyncSession, payloads: List[Dict[str, Any]]
+) -> BatchResultSchema:
+    results = [BatchItemResultSchema(index=index) for index in range(len(payloads))]
+    updates: Dict[UUID, Tuple[int, ProjectBatchUpdateSchema]] = {}
+    for index, payload in enumerate(payloads):
+        try:
+            project_data = ProjectBatchUpdateSchema.model_validate(payload)
+        except ValidationError as exc:
+            results[index].errors = _validation_errors(exc)
+            continue
+        results[index].id = project_data.id
+        if project_data.id in updates:
+            results[index].errors = [ErrorMessages.DUPLICATE_IN_BATCH]
+            continue
+        updates[project_data.id] = index, project_data
+
+    if not updates:
+        return _batch_result(results)
+
+    existing = {
+        row.id: row
+        for row in await db.execute(
+            select(
+                Project.id, Project.name, Project.start_date, Project.end_date
+            ).where(Project.id.in_(updates))
+        )
+    }
+    new_names = {
+        project_data.name
+        for _, project_data in updates.values()
+        if project_data.name is not None
+    }
+    name_owners: Dict[str, UUID] = {
+        name: project_id
+        for name, project_id in await db.execute(
+            select(Project.name, Project.id).where(Project.name.in_(new_names))
+        )
+    }
+
+    rows: List[Dict[str, Any]] = []
+    claimed_names: Set[str] = set()
+    for project_id, (index, project_data) in updates.items():
+        current = existing.get(project_id)
+        if current is None:
+            results[index].errors = [ErrorMessages.PROJECT_NOT_FOUND]
+            continue
+        if project_data.name is not None:
+            if name_owners.get(project_data.name, project_id) != project_id:
+                results[index].errors = [ErrorMessages.PROJECT_NAME_TAKEN]
+                continue
+            if project_data.name in claimed_names:
+                results[index].errors = [ErrorMessages.DUPLICATE_IN_BATCH]
+                continue
+        start_date = project_data.start_date or current.start_date
+        end_date = project_data.end_date or current.end_date
+        if start_date > end_date:
+            results[index].errors = [ErrorMessages.INVALID_DATE_RANGE]
+            continue
+        if project_data.name is not None:
+            claimed_names.add(project_data.name)
+        rows.append(_project_columns(project_data.model_dump(exclude_none=True)))
+
+    if rows:
+        await db.execute(update(Project), rows)
+
+    return _batch_result(results)
+
+
+async def delete_projects(
+    db: AsyncSession, project_ids: List[UUID]
+) -> BatchResultSchema:
+    deleted: Set[UUID] = set(
+        await db.scalars(
+            delete(Project)
+            .where(Project.id.in_(project_ids))
+            .returning(Project.id)
+            .execution_options(synchronize_session=False)
+        )
+    )
+    results = [
+        BatchItemResultSchema(
+            index=index,
+            id=project_id,
+            errors=[] if project_id in deleted else [ErrorMessages.PROJECT_NOT_FOUND],
+        )
+        for index, project_id in enumerate(project_ids)
+    ]
+    return _batch_result(results)
+
+
+async def convert_geometry_storage(
+    db: AsyncSession, storage: GeometryStorage, batch_size: int
+) -> AsyncIterator[int]:
+    # Tables created before binary storage existed lack the column.
+    await db.execute(
+        text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS area_of_interest_wkb BYTEA")
+    )
+    await db.commit()
+
+    last_id: UUID | None = None
+    while True:
+        query = (
+            select(
+                Project.id,
+                Project.area_of_interest_json,
+                Project.area_of_interest_wkb,
+            )
+            .order_by(Project.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            query = query.where(Project.id > last_id)
+        rows = (await db.execute(query)).all()
+        if not rows:
+            return
+
+        converted = [
+            {
+                "id": row.id,
+                **area_of_interest_columns(
+                    decode_area_of_interest(
+                        row.area_of_interest_json, row.area_of_interest_wkb
+                    ),
+                    storage,
+                ),
+            }
+            for row in rows
+            if (row.area_of_interest_wkb is None) != (storage is GeometryStorage.JSON)
+        ]
+        if converted:
+            await db.execute(update(Project), converted)
+        await db.commit()
+        last_id = rows[-1].id
+        yield len(converted)
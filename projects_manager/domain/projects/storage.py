@@ -0,0 +1,52 @@
+from typing import Any, Dict, Tuple
+
+from projects_manager.config.settings import GeometryStorage
+from projects_manager.domain.projects.geometry import (
+    GeometryError,
+    arrays_to_coordinates,
+    arrays_to_wkb,
+    multipolygon_to_arrays,
+    wkb_to_arrays,
+)
+
+
+def encode_area_of_interest(
+    area_of_interest: Dict[str, Any], storage: GeometryStorage
+) -> Tuple[Dict[str, Any], bytes | None]:
+    if storage is GeometryStorage.JSON:
+        return area_of_interest, None
+
+    geometry = dict(area_of_interest["geometry"])
+    try:
+        arrays = multipolygon_to_arrays(geometry["coordinates"], allow_altitude=False)
+    except GeometryError:
+        # Positions with altitudes stay in JSON; WKB stores lon/lat only.
+        return area_of_interest, None
+
+    # The JSON column keeps everything but the coordinates.
+    del geometry["coordinates"]
+    return {**area_of_interest, "geometry": geometry}, arrays_to_wkb(arrays)
+
+
+def decode_area_of_interest(
+    area_of_interest: Dict[str, Any], geometry_wkb: bytes | None
+) -> Dict[str, Any]:
+    if geometry_wkb is None:
+        return area_of_interest
+    coordinates = arrays_to_coordinates(wkb_to_arrays(geometry_wkb))
+    return {
+        **area_of_interest,
+        "geometry": {**area_of_interest["geometry"], "coordinates": coordinates},
+    }
+
+
+def area_of_interest_columns(
+    area_of_interest: Dict[str, Any], storage: GeometryStorage
+) -> Dict[str, Any]:
+    area_of_interest_json, area_of_interest_wkb = encode_area_of_interest(
+        area_of_interest, storage
+    )
+    return {
+        "area_of_interest_json": area_of_interest_json,
+        "area_of_interest_wkb": area_of_interest_wkb,
+    }
@@ -33,3 +33,7 @@ def http_error_handler(_: Request, exc: Exception) -> JSONResponse:
 
 class ErrorMessages:
     PROJECT_NOT_FOUND = "PROJECT_NOT_FOUND"
+    INVALID_CURSOR = "INVALID_CURSOR"
+    PROJECT_NAME_TAKEN = "PROJECT_NAME_TAKEN"
+    DUPLICATE_IN_BATCH = "DUPLICATE_IN_BATCH"
+    INVALID_DATE_RANGE = "INVALID_DATE_RANGE"
@@ -1,19 +1,44 @@
 import logging
 
+from typing import Any, Dict, List
 from uuid import UUID
-from fastapi import APIRouter, Depends
-from fastapi_pagination import Page
+from fastapi import APIRouter, Body, Depends, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi_pagination import Page, Params, set_page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from projects_manager.config.cache import InMemoryCache
-from projects_manager.config.dependencies import get_db
+from projects_manager.config.dependencies import (
+    ValidatedBody,
+    get_db,
+    get_sessionmaker,
+)
+from projects_manager.config.invalidation import publish_invalidation
+from projects_manager.config.settings import get_settings
+from projects_manager.config.workers import WorkerPool
+from projects_manager.domain.common.pagination import paginate_by_keyset
+from projects_manager.domain.common.schemas import CursorPage
+from projects_manager.domain.projects.export import ExportFormat, stream_projects
+from projects_manager.domain.projects.importer import (
+    GeoJSONStreamError,
+    import_feature_collection,
+)
 from projects_manager.domain.projects.models import Project
-from projects_manager.domain.projects.services import get_project_by_id
+from projects_manager.domain.projects.services import (
+    create_projects,
+    delete_projects,
+    get_project_by_id,
+    projects_list_query,
+    update_projects,
+)
 from projects_manager.domain.projects.schemas import (
+    BatchResultSchema,
+    ImportReportSchema,
     ProjectDetailsSchema,
     ProjectCreateSchema,
+    ProjectListView,
+    ProjectSummarySchema,
     ProjectUpdateSchema,
 )
 
@@ -24,70 +49,119 @@ projects_router = APIRouter(
 )
 
 logger = logging.getLogger(__name__)
-cache = InMemoryCache()
+cache = InMemoryCache(
+    expiration_time=get_settings().cache_expiration_time,
+    max_entries=get_settings().cache_max_entries,
+    max_bytes=get_settings().cache_max_bytes,
+)
+validation_pool = WorkerPool(
+    get_settings().validation_pool_kind, get_settings().validation_pool_size
+)
+validated_create_body = ValidatedBody(ProjectCreateSchema, validation_pool)
+validated_update_body = ValidatedBody(
+    ProjectUpdateSchema, validation_pool, exclude_none=True
+)
 
 
-@projects_router.post("/create", response_model=ProjectDetailsSchema)
+@projects_router.post(
+    "/create",
+    response_model=ProjectDetailsSchema,
+    openapi_extra=validated_create_body.openapi_extra,
+)
 async def create_project(
-    project_data: ProjectCreateSchema,
-    db: Session = Depends(get_db),
+    project_data: Dict[str, Any] = Depends(validated_create_body),
+    db: AsyncSession = Depends(get_db),
 ) -> ProjectDetailsSchema:
-    new_project = Project(
-        name=project_data.name,
-        description=project_data.description,
-        start_date=project_data.start_date,
-        end_date=project_data.end_date,
-        area_of_interest=project_data.area_of_interest.model_dump(),
-    )
+    new_project = Project(**project_data)
     db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
+    await db.commit()
     return ProjectDetailsSchema.model_validate(new_project)
 
 
-@projects_router.get("/list", response_model=Page[ProjectDetailsSchema])
+@projects_router.get(
+    "/list",
+    response_model=Page[ProjectDetailsSchema] | Page[ProjectSummarySchema],
+)
 async def list_projects(
-    db: Session = Depends(get_db),
-) -> Page[ProjectDetailsSchema]:
-    return paginate(db, select(Project))
+    view: ProjectListView = ProjectListView.FULL,
+    params: Params = Depends(),
+    db: AsyncSession = Depends(get_db),
+) -> Page[ProjectDetailsSchema] | Page[ProjectSummarySchema]:
+    with set_page(Page[view.schema]):
+        return await paginate(
+            db,
+            projects_list_query(view).order_by(Project.created_at, Project.id),
+            params=params,
+        )
+
+
+@projects_router.get(
+    "/list/cursor",
+    response_model=CursorPage[ProjectDetailsSchema] | CursorPage[ProjectSummarySchema],
+)
+async def list_projects_by_cursor(
+    view: ProjectListView = ProjectListView.FULL,
+    cursor: str | None = None,
+    size: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> CursorPage[ProjectDetailsSchema] | CursorPage[ProjectSummarySchema]:
+    projects, next_cursor = await paginate_by_keyset(
+        db, Project, projects_list_query(view), cursor, size
+    )
+    return CursorPage[view.schema](
+        items=[view.schema.model_validate(project) for project in projects],
+        size=size,
+        next_cursor=next_cursor,
+    )
+
+
+@projects_router.get("/export", response_class=StreamingResponse)
+async def export_projects(
+    export_format: ExportFormat = Query(ExportFormat.GEOJSON, alias="format"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
+) -> StreamingResponse:
+    # The stream outlives request dependencies, so it opens its own session.
+    return StreamingResponse(
+        stream_projects(
+            session_factory, export_format, get_settings().export_chunk_size
+        ),
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename=projects.{export_format.value}"
+        },
+    )
 
 
 @projects_router.get("/details/{project_id}", response_model=ProjectDetailsSchema)
 async def get_project_details(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> ProjectDetailsSchema:
-    cache_key = f"project_details:{project_id}"
-    cached_project = cache.get(cache_key)
-    if cached_project:
-        return cached_project
+    async def load_project_details() -> ProjectDetailsSchema:
+        project = await get_project_by_id(project_id, db)
+        return ProjectDetailsSchema.model_validate(project)
 
-    project = await get_project_by_id(project_id, db)
-    project_data = ProjectDetailsSchema.model_validate(project)
-    cache.set(cache_key, project_data)
-    return project_data
+    return await cache.get_or_load(
+        f"project_details:{project_id}", load_project_details
+    )
 
 
-@projects_router.patch("/update/{project_id}", response_model=ProjectDetailsSchema)
+@projects_router.patch(
+    "/update/{project_id}",
+    response_model=ProjectDetailsSchema,
+    openapi_extra=validated_update_body.openapi_extra,
+)
 async def update_project(
     project_id: UUID,
-    project_data: ProjectUpdateSchema,
-    db: Session = Depends(get_db),
+    project_data: Dict[str, Any] = Depends(validated_update_body),
+    db: AsyncSession = Depends(get_db),
 ) -> ProjectDetailsSchema:
     project = await get_project_by_id(project_id, db)
-    if project_data.name is not None:
-        project.name = project_data.name
-    if project_data.description is not None:
-        project.description = project_data.description
-    if project_data.start_date is not None:
-        project.start_date = project_data.start_date
-    if project_data.end_date is not None:
-        project.end_date = project_data.end_date
-    if project_data.area_of_interest is not None:
-        project.area_of_interest = project_data.area_of_interest.model_dump()
-
-    db.commit()
-    db.refresh(project)
+    for field, value in project_data.items():
+        setattr(project, field, value)
+
+    await publish_invalidation(db, [f"project_details:{project_id}"])
+    await db.commit()
 
     updated_project = ProjectDetailsSchema.model_validate(project)
     cache.set(f"project_details:{project_id}", updated_project)
@@ -95,8 +169,87 @@ async def update_project(
 
 
 @projects_router.delete("/delete/{project_id}")
-async def delete_project(project_id: UUID, db: Session = Depends(get_db)):
+async def delete_project(project_id: UUID, db: AsyncSession = Depends(get_db)):
     project = await get_project_by_id(project_id, db)
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await publish_invalidation(db, [f"project_details:{project_id}"])
+    await db.commit()
     cache.clear(f"project_details:{project_id}")
+
+
+async def _invalidate_project_details(db: AsyncSession, project_ids: List[UUID]):
+    cache_keys = [f"project_details:{project_id}" for project_id in project_ids]
+    await publish_invalidation(db, cache_keys)
+    await db.commit()
+    for cache_key in cache_keys:
+        cache.clear(cache_key)
+
+
+@projects_router.post("/batch/create", response_model=BatchResultSchema)
+async def create_projects_batch(
+    payloads: List[Dict[str, Any]] = Body(
+        ..., min_length=1, max_length=get_settings().batch_max_size
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> BatchResultSchema:
+    result = await create_projects(db, payloads)
+    await db.commit()
+    return result
+
+
+@projects_router.patch("/batch/update", response_model=BatchResultSchema)
+async def update_projects_batch(
+    payloads: List[Dict[str, Any]] = Body(
+        ..., min_length=1, max_length=get_settings().batch_max_size
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> BatchResultSchema:
+    result = await update_projects(db, payloads)
+    await _invalidate_project_details(
+        db, [item.id for item in result.items if item.id and not item.errors]
+    )
+    return result
+
+
+@projects_router.post("/batch/delete", response_model=BatchResultSchema)
+async def delete_projects_batch(
+    ids: List[UUID] = Body(
+        ..., embed=True, min_length=1, max_length=get_settings().batch_max_size
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> BatchResultSchema:
+    result = await delete_projects(db, ids)
+    await _invalidate_project_details(
+        db, [item.id for item in result.items if item.id and not item.errors]
+    )
+    return result
+
+
+@projects_router.post(
+    "/import",
+    response_model=ImportReportSchema,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/geo+json": {"schema": {"type": "object"}}},
+        }
+    },
+)
+async def import_projects(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> ImportReportSchema | JSONResponse:
+    report = ImportReportSchema(succeeded=0, failed=0, items=[])
+    try:
+        async for result in import_feature_collection(
+            db, request.stream(), get_settings().import_batch_size
+        ):
+            report.succeeded += result.succeeded
+            report.failed += result.failed
+            report.items.extend(result.items)
+    except GeoJSONStreamError as exc:
+        report.errors.append(str(exc))
+        return JSONResponse(
+            report.model_dump(mode="json"), status_code=status.HTTP_400_BAD_REQUEST
+        )
+    return report
@@ -0,0 +1,107 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+from data.samples import SAMPLE_GEOJSON
+
+
+def _project_payload(name: str, **overrides):
+    return {
+        "name": name,
+        "description": f"{name} description",
+        "start_date": date.today().strftime("%Y-%m-%d"),
+        "end_date": (date.today() + timedelta(days=30)).strftime("%Y-%m-%d"),
+        "area_of_interest": SAMPLE_GEOJSON,
+        **overrides,
+    }
+
+
+def test_batch_create_reports_errors_per_item(client, test_project):
+    payloads = [
+        _project_payload("Batch 1"),
+        _project_payload("Batch 2"),
+        {"name": "Missing fields"},
+        _project_payload("Batch 1"),
+        _project_payload(test_project.name),
+    ]
+
+    response = client.post("/api/projects/batch/create", json=payloads)
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["succeeded"] == 2
+    assert response_data["failed"] == 3
+    items = response_data["items"]
+    assert [item["index"] for item in items] == list(range(5))
+    assert items[0]["id"] and not items[0]["errors"]
+    assert items[1]["id"] and not items[1]["errors"]
+    assert items[2]["errors"]
+    assert items[3]["errors"] == ["DUPLICATE_IN_BATCH"]
+    assert items[4]["errors"] == ["PROJECT_NAME_TAKEN"]
+
+    details_response = client.get(f"/api/projects/details/{items[0]['id']}")
+    assert details_response.status_code == 200
+    assert details_response.json()["name"] == "Batch 1"
+
+
+def test_batch_create_rejects_empty_batch(client):
+    response = client.post("/api/projects/batch/create", json=[])
+    assert response.status_code == 422
+
+
+def test_batch_update_reports_errors_per_item(client, test_project, dummy_project):
+    other_project = dummy_project(**_project_payload("Other Project"))
+    client.get(f"/api/projects/details/{test_project.id}")
+    missing_id = str(uuid4())
+
+    response = client.patch(
+        "/api/projects/batch/update",
+        json=[
+            {"id": str(test_project.id), "description": "Batch description"},
+            {"id": missing_id, "description": "Nope"},
+            {
+                "id": str(other_project.id),
+                "end_date": (date.today() - timedelta(days=1)).strftime("%Y-%m-%d"),
+            },
+            {"id": str(other_project.id), "name": test_project.name},
+        ],
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["succeeded"] == 1
+    items = response_data["items"]
+    assert items[0]["id"] == str(test_project.id) and not items[0]["errors"]
+    assert items[1]["errors"] == ["PROJECT_NOT_FOUND"]
+    assert items[2]["errors"] == ["INVALID_DATE_RANGE"]
+    assert items[3]["errors"] == ["DUPLICATE_IN_BATCH"]
+
+    details_response = client.get(f"/api/projects/details/{test_project.id}")
+    assert details_response.json()["description"] == "Batch description"
+
+
+def test_batch_update_rejects_taken_name(client, test_project, dummy_project):
+    other_project = dummy_project(**_project_payload("Other Project"))
+
+    response = client.patch(
+        "/api/projects/batch/update",
+        json=[{"id": str(other_project.id), "name": test_project.name}],
+    )
+
+    assert response.status_code == 200
+    assert response.json()["items"][0]["errors"] == ["PROJECT_NAME_TAKEN"]
+
+
+def test_batch_delete_reports_missing_projects(client, test_project):
+    client.get(f"/api/projects/details/{test_project.id}")
+    missing_id = str(uuid4())
+
+    response = client.post(
+        "/api/projects/batch/delete", json={"ids": [str(test_project.id), missing_id]}
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["succeeded"] == 1
+    assert response_data["items"][1]["errors"] == ["PROJECT_NOT_FOUND"]
+    assert client.get(f"/api/projects/details/{test_project.id}").status_code == 404
+    assert client.get("/api/projects/list").json()["total"] == 0
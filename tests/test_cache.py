@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from projects_manager.config.cache import InMemoryCache
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = InMemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_respects_byte_budget():
+    cache = InMemoryCache(max_bytes=10, sizeof=len)
+    cache.set("a", "x" * 6)
+    cache.set("b", "y" * 6)
+    cache.set("too_big", "z" * 11)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 6
+    assert cache.get("too_big") is None
+    assert cache.stats()["size_bytes"] == 6
+
+
+def test_cache_expires_entries():
+    cache = InMemoryCache(expiration_time=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+
+
+def test_get_or_load_runs_single_loader_for_concurrent_misses():
+    cache = InMemoryCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(20))
+        )
+
+    assert asyncio.run(run()) == ["value"] * 20
+    assert calls == 1
+    assert cache.get("key") == "value"
+    assert cache.stats()["loads"] == 1
+
+
+def test_get_or_load_propagates_errors_without_caching():
+    cache = InMemoryCache()
+
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise LookupError("missing")
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, LookupError) for result in results)
+    assert cache.get("key") is None
+
+
+def test_get_or_load_skips_caching_after_invalidation():
+    cache = InMemoryCache()
+
+    async def loader():
+        cache.clear("key")
+        return "stale"
+
+    assert asyncio.run(cache.get_or_load("key", loader)) == "stale"
+    assert cache.get("key") is None
+
+
+@pytest.mark.parametrize("value", [{"a": [1.0, 2.0]}, [[1.0, 2.0], [3.0, 4.0]]])
+def test_cache_tracks_nested_value_size(value):
+    cache = InMemoryCache()
+    cache.set("key", value)
+    assert cache.stats()["size_bytes"] > 0
+    cache.clear("key")
+    assert cache.stats()["size_bytes"] == 0
@@ -0,0 +1,56 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from data.samples import SAMPLE_GEOJSON
+from projects_manager.config.settings import get_settings
+
+
+@pytest.fixture()
+def exported_projects(dummy_project, monkeypatch):
+    monkeypatch.setattr(get_settings(), "export_chunk_size", 2)
+    today = date.today()
+    return [
+        dummy_project(
+            name=f"Export {index}",
+            description=f"Export description {index}",
+            start_date=today,
+            end_date=today + timedelta(days=30),
+            area_of_interest=SAMPLE_GEOJSON,
+        )
+        for index in range(5)
+    ]
+
+
+def test_export_projects_as_geojson(client, exported_projects):
+    response = client.get("/api/projects/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/geo+json"
+    feature_collection = response.json()
+    assert feature_collection["type"] == "FeatureCollection"
+    features = feature_collection["features"]
+    assert [feature["id"] for feature in features] == [
+        str(project.id) for project in exported_projects
+    ]
+    assert features[0]["geometry"] == SAMPLE_GEOJSON["geometry"]
+    assert features[0]["properties"]["name"] == "Export 0"
+    assert features[0]["properties"]["start_date"] == date.today().isoformat()
+
+
+def test_export_projects_as_ndjson(client, exported_projects):
+    response = client.get("/api/projects/export", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    features = [json.loads(line) for line in response.text.splitlines()]
+    assert len(features) == len(exported_projects)
+    assert all(feature["type"] == "Feature" for feature in features)
+
+
+def test_export_empty_table(client):
+    response = client.get("/api/projects/export")
+
+    assert response.status_code == 200
+    assert response.json() == {"type": "FeatureCollection", "features": []}
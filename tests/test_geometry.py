@@ -0,0 +1,87 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from data.generators import generate_multipolygon, generate_ring
+from data.samples import SAMPLE_GEOJSON
+from projects_manager.domain.projects.geometry import (
+    GeometryError,
+    find_self_intersections,
+    multipolygon_to_arrays,
+    segments_intersect,
+    validate_multipolygon,
+)
+
+SQUARE = [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]]
+HOLE = [[1.0, 1.0], [1.0, 2.0], [2.0, 2.0], [2.0, 1.0], [1.0, 1.0]]
+
+
+@pytest.mark.parametrize(
+    "coordinates",
+    [
+        SAMPLE_GEOJSON["geometry"]["coordinates"],
+        [[SQUARE]],
+        [[SQUARE, HOLE]],
+        [[SQUARE], [[[p[0] + 10, p[1]] for p in SQUARE]]],
+        [[[[0, 0], [4, 0], [4, 0], [4, 4], [0, 4], [0, 0]]]],
+        [[[[0, 0, 10], [4, 0, 10], [4, 4, 12], [0, 4, 12], [0, 0, 10]]]],
+        generate_multipolygon(10_000, polygon_count=3)["geometry"]["coordinates"],
+    ],
+)
+def test_valid_multipolygons(coordinates):
+    arrays = validate_multipolygon(coordinates)
+    assert arrays.coordinates.dtype == np.float64
+    assert arrays.coordinates.flags["C_CONTIGUOUS"]
+
+
+@pytest.mark.parametrize(
+    "coordinates,message",
+    [
+        ([], "non-empty"),
+        ([[]], "structure"),
+        ([[[[0, 0], [1, 1], [0, 0]]]], "structure"),
+        ([[[[0, 0], [4, 0], [4, 4], [0, 4]]]], "closed"),
+        ([[[[0, 0], [200, 0], [200, 4], [0, 4], [0, 0]]]], "longitude"),
+        ([[[[0, 0], [4, 0], [4, 95], [0, 4], [0, 0]]]], "latitude"),
+        ([[[[0, 0], [1, 1], [2, 2], [3, 3], [0, 0]]]], "non-zero area"),
+        ([[[["0", "0"], [4, 0], [4, 4], [0, 4], ["0", "0"]]]], "pair"),
+        ([[[[0, 0], [4], [4, 4], [0, 4], [0, 0]]]], "pair"),
+        ([[[[0, 0], [4, 4], [4, 0], [0, 6], [0, 0]]]], "intersect"),
+        ([[SQUARE, [[3, 1], [3, 2], [5, 2], [5, 1], [3, 1]]]], "intersect"),
+        ([[[[0, 0], [4, 0], [2, 2], [4, 4], [0, 4], [2, 2], [0, 0]]]], "intersect"),
+    ],
+)
+def test_invalid_multipolygons(coordinates, message):
+    with pytest.raises(GeometryError, match=message):
+        validate_multipolygon(coordinates)
+
+
+def _brute_force_intersections(coordinates):
+    arrays = multipolygon_to_arrays(coordinates)
+    ring = arrays.coordinates
+    segments = len(ring) - 1
+    found = False
+    for first, second in itertools.combinations(range(segments), 2):
+        if second - first == 1 or (first == 0 and second == segments - 1):
+            continue
+        hit = segments_intersect(
+            ring[[first]], ring[[first + 1]], ring[[second]], ring[[second + 1]]
+        )
+        found = found or bool(hit[0])
+    return found
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_self_intersections_match_brute_force(seed):
+    rng = random.Random(seed)
+    points = [[rng.uniform(0, 10), rng.uniform(0, 10)] for _ in range(12)]
+    coordinates = [[points + [points[0]]]]
+    if seed % 2:
+        coordinates = [[generate_ring(12, center=(5, 5), radius=4, seed=seed)]]
+
+    arrays = multipolygon_to_arrays(coordinates)
+    assert bool(len(find_self_intersections(arrays))) == _brute_force_intersections(
+        coordinates
+    )
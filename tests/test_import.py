@@ -0,0 +1,135 @@
+import asyncio
+import io
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from data.samples import SAMPLE_GEOJSON
+from projects_manager.cli import import_geojson
+from projects_manager.config.settings import get_settings
+from projects_manager.domain.projects.importer import (
+    FeatureCollectionParser,
+    GeoJSONStreamError,
+)
+
+
+def _feature(name: str, **properties):
+    return {
+        "type": "Feature",
+        "properties": {
+            "name": name,
+            "start_date": date.today().isoformat(),
+            "end_date": (date.today() + timedelta(days=30)).isoformat(),
+            **properties,
+        },
+        "geometry": SAMPLE_GEOJSON["geometry"],
+    }
+
+
+def _parse_in_chunks(document: bytes, chunk_size: int):
+    parser = FeatureCollectionParser()
+    features = []
+    for start in range(0, len(document), chunk_size):
+        features.extend(parser.feed(document[start : start + chunk_size]))
+    features.extend(parser.close())
+    return features
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_parser_yields_features_across_chunk_boundaries(chunk_size):
+    features = [_feature(f"Plot {index}", note="żółw") for index in range(3)]
+    document = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "crs": {"type": "name", "properties": {"name": "EPSG:4326"}},
+            "features": features,
+            "bbox": [-53.0, -6.0, -52.0, -5.0],
+        },
+        ensure_ascii=False,
+        indent=2,
+    ).encode()
+
+    assert _parse_in_chunks(document, chunk_size) == features
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"type": "FeatureCollection", "features": [{"type": "Feature"}',
+        b'{"type": "FeatureCollection", "features": [] } trailing',
+        b'{"type": "Feature", "features": []}',
+        b'{"type": "FeatureCollection"}',
+        b"[]",
+    ],
+)
+def test_parser_rejects_invalid_documents(document):
+    with pytest.raises(GeoJSONStreamError):
+        _parse_in_chunks(document, 5)
+
+
+def test_import_projects_reports_each_feature(client, test_project, monkeypatch):
+    monkeypatch.setattr(get_settings(), "import_batch_size", 2)
+    invalid_geometry = _feature("Invalid Plot")
+    invalid_geometry["geometry"] = {"type": "Point", "coordinates": [0, 0]}
+    document = {
+        "type": "FeatureCollection",
+        "features": [
+            _feature("Imported 1", description="First", source="survey"),
+            invalid_geometry,
+            _feature(test_project.name),
+            _feature("Imported 2"),
+        ],
+    }
+
+    response = client.post(
+        "/api/projects/import",
+        content=json.dumps(document),
+        headers={"Content-Type": "application/geo+json"},
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["succeeded"] == 2
+    assert report["failed"] == 2
+    items = report["items"]
+    assert [item["index"] for item in items] == [0, 1, 2, 3]
+    assert items[1]["errors"]
+    assert items[2]["errors"] == ["PROJECT_NAME_TAKEN"]
+
+    details = client.get(f"/api/projects/details/{items[0]['id']}").json()
+    assert details["description"] == "First"
+    assert details["area_of_interest"]["properties"] == {"source": "survey"}
+
+
+def test_import_projects_rejects_malformed_stream(client):
+    response = client.post(
+        "/api/projects/import",
+        content=b'{"type": "FeatureCollection", "features": [',
+    )
+
+    assert response.status_code == 400
+    assert response.json()["errors"]
+
+
+def test_cli_import_geojson(tmp_path, test_async_sessionmaker):
+    path = tmp_path / "plots.geojson"
+    path.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [_feature("CLI 1"), _feature("CLI 2"), {"type": "Feature"}],
+            }
+        )
+    )
+    output = io.StringIO()
+
+    failed = asyncio.run(
+        import_geojson(str(path), 2, test_async_sessionmaker, output=output)
+    )
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 1
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert lines[0]["id"] and lines[1]["id"]
+    assert lines[2]["errors"]
@@ -0,0 +1,127 @@
+import asyncio
+
+from projects_manager.config.cache import InMemoryCache
+from projects_manager.config.invalidation import (
+    CacheInvalidationListener,
+    publish_invalidation,
+)
+
+LISTENERS_COUNT = 3
+
+
+async def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(0.01)
+    return predicate()
+
+
+async def _start_listeners(dsn: str) -> list[CacheInvalidationListener]:
+    listeners = [
+        CacheInvalidationListener(dsn, InMemoryCache()) for _ in range(LISTENERS_COUNT)
+    ]
+    for listener in listeners:
+        listener.cache.set("project_details:1", "first")
+        listener.cache.set("project_details:2", "second")
+        await listener.start()
+    return listeners
+
+
+def test_committed_invalidation_reaches_every_listener(
+    test_database_url, test_async_sessionmaker
+):
+    async def run():
+        listeners = await _start_listeners(test_database_url)
+        try:
+            async with test_async_sessionmaker() as db:
+                await publish_invalidation(db, ["project_details:1"])
+                await db.commit()
+
+            assert await _wait_until(
+                lambda: all(
+                    listener.cache.get("project_details:1") is None
+                    for listener in listeners
+                )
+            )
+            for listener in listeners:
+                assert listener.cache.get("project_details:2") == "second"
+        finally:
+            for listener in listeners:
+                await listener.stop()
+
+    asyncio.run(run())
+
+
+def test_rolled_back_invalidation_is_not_delivered(
+    test_database_url, test_async_sessionmaker
+):
+    async def run():
+        listeners = await _start_listeners(test_database_url)
+        try:
+            async with test_async_sessionmaker() as db:
+                await publish_invalidation(db, ["project_details:1"])
+                await db.rollback()
+                await publish_invalidation(db, ["project_details:2"])
+                await db.commit()
+
+            assert await _wait_until(
+                lambda: all(
+                    listener.cache.get("project_details:2") is None
+                    for listener in listeners
+                )
+            )
+            for listener in listeners:
+                assert listener.cache.get("project_details:1") == "first"
+        finally:
+            for listener in listeners:
+                await listener.stop()
+
+    asyncio.run(run())
+
+
+def test_large_invalidation_is_split_into_several_notifications(
+    test_database_url, test_async_sessionmaker
+):
+    keys = [f"project_details:{index:08d}" for index in range(2000)]
+
+    async def run():
+        listener = CacheInvalidationListener(test_database_url, InMemoryCache())
+        for key in keys:
+            listener.cache.set(key, key)
+        await listener.start()
+        try:
+            async with test_async_sessionmaker() as db:
+                await publish_invalidation(db, keys)
+                await db.commit()
+
+            assert await _wait_until(lambda: listener.cache.stats()["entries"] == 0)
+        finally:
+            await listener.stop()
+
+    asyncio.run(run())
+
+
+def test_update_project_invalidates_other_workers(
+    client, test_database_url, test_project
+):
+    cache_key = f"project_details:{test_project.id}"
+
+    async def run():
+        other_worker = CacheInvalidationListener(test_database_url, InMemoryCache())
+        other_worker.cache.set(cache_key, "stale")
+        await other_worker.start()
+        try:
+            response = await asyncio.to_thread(
+                client.patch,
+                f"/api/projects/update/{test_project.id}",
+                json={"description": "Fresh description"},
+            )
+            assert response.status_code == 200
+            assert await _wait_until(lambda: other_worker.cache.get(cache_key) is None)
+        finally:
+            await other_worker.stop()
+
+    asyncio.run(run())
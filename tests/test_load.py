@@ -0,0 +1,72 @@
+import threading
+import time
+
+import anyio
+import httpx
+from sqlalchemy import text
+
+CONCURRENT_REQUESTS = 10
+LOCK_WAIT_TIMEOUT = 10.0
+
+
+def _hold_projects_lock(test_engine, locked: threading.Event, waiters: list[int]):
+    with test_engine.connect() as lock_connection, test_engine.connect() as monitor:
+        lock_connection.execute(text("LOCK TABLE projects IN ACCESS EXCLUSIVE MODE"))
+        locked.set()
+        deadline = time.monotonic() + LOCK_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            waiting = monitor.execute(
+                text(
+                    "SELECT count(*) FROM pg_stat_activity "
+                    "WHERE datname = current_database() AND wait_event_type = 'Lock'"
+                )
+            ).scalar_one()
+            monitor.rollback()
+            waiters.append(waiting)
+            if waiting >= CONCURRENT_REQUESTS:
+                break
+            time.sleep(0.01)
+        lock_connection.rollback()
+
+
+def test_list_projects_concurrent_requests_do_not_serialize(
+    client, test_engine, test_db, test_project
+):
+    test_db.close()
+    locked = threading.Event()
+    waiters: list[int] = []
+    lock_holder = threading.Thread(
+        target=_hold_projects_lock, args=(test_engine, locked, waiters)
+    )
+    lock_holder.start()
+    assert locked.wait(LOCK_WAIT_TIMEOUT)
+
+    async def run_requests():
+        statuses: list[int] = []
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+
+            async def fetch():
+                response = await async_client.get("/api/projects/list")
+                statuses.append(response.status_code)
+
+            async with anyio.create_task_group() as task_group:
+                for _ in range(CONCURRENT_REQUESTS):
+                    task_group.start_soon(fetch)
+        return statuses
+
+    started = time.perf_counter()
+    statuses = anyio.run(run_requests)
+    elapsed = time.perf_counter() - started
+    lock_holder.join()
+
+    assert statuses == [200] * CONCURRENT_REQUESTS
+    # Every request must be parked in Postgres at the same time; a blocking
+    # driver would let at most one of them reach the lock.
+    assert max(waiters) >= CONCURRENT_REQUESTS
+    print(
+        f"{CONCURRENT_REQUESTS} concurrent requests in {elapsed:.3f}s "
+        f"({CONCURRENT_REQUESTS / elapsed:.1f} req/s)"
+    )
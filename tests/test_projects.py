@@ -1,6 +1,7 @@
 import pytest
 from uuid import uuid4
 from datetime import date, timedelta
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from data.samples import SAMPLE_GEOJSON
@@ -93,6 +94,74 @@ def test_get_projects_list(client, test_project):
     assert response.json()["total"] == 1
 
 
+@pytest.mark.parametrize("url", ["/api/projects/list", "/api/projects/list/cursor"])
+def test_get_projects_list__summary_view(client, test_async_engine, test_project, url):
+    statements = []
+
+    def record_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(
+        test_async_engine.sync_engine, "before_cursor_execute", record_statement
+    )
+    try:
+        response = client.get(url, params={"view": "summary"})
+    finally:
+        event.remove(
+            test_async_engine.sync_engine, "before_cursor_execute", record_statement
+        )
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item["id"] == str(test_project.id)
+    assert item["name"] == test_project.name
+    assert "area_of_interest" not in item
+    item_statements = [
+        statement for statement in statements if "count(" not in statement
+    ]
+    assert item_statements
+    assert not any("area_of_interest" in statement for statement in item_statements)
+
+
+def test_get_projects_list__invalid_view(client):
+    response = client.get("/api/projects/list", params={"view": "everything"})
+    assert response.status_code == 422
+
+
+def test_get_projects_list_by_cursor(client, dummy_project):
+    today = date.today()
+    projects = [
+        dummy_project(
+            name=f"Project {index}",
+            start_date=today,
+            end_date=today + timedelta(days=30),
+            area_of_interest=SAMPLE_GEOJSON,
+        )
+        for index in range(5)
+    ]
+
+    seen_ids = []
+    cursor = None
+    while True:
+        params = {"size": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/projects/list/cursor", params=params)
+        assert response.status_code == 200
+        response_data = response.json()
+        assert "total" not in response_data
+        seen_ids.extend(item["id"] for item in response_data["items"])
+        cursor = response_data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen_ids == [str(project.id) for project in projects]
+
+
+def test_get_projects_list_by_cursor__invalid_cursor(client, test_project):
+    response = client.get("/api/projects/list/cursor", params={"cursor": "invalid"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "INVALID_CURSOR"
+
+
 def test_get_project_details__valid_id(client, test_project):
     response = client.get(f"/api/projects/details/{test_project.id}")
     assert response.status_code == 200
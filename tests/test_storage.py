@@ -0,0 +1,119 @@
+import asyncio
+import io
+
+import pytest
+
+from data.generators import generate_multipolygon
+from data.samples import SAMPLE_GEOJSON
+from projects_manager.cli import migrate_geometry
+from projects_manager.config.settings import GeometryStorage, get_settings
+from projects_manager.domain.projects.geometry import (
+    GeometryError,
+    arrays_to_coordinates,
+    arrays_to_wkb,
+    multipolygon_to_arrays,
+    wkb_to_arrays,
+)
+from projects_manager.domain.projects.models import Project
+from projects_manager.domain.projects.storage import (
+    decode_area_of_interest,
+    encode_area_of_interest,
+)
+
+
+@pytest.fixture()
+def binary_storage(monkeypatch):
+    monkeypatch.setattr(get_settings(), "geometry_storage", GeometryStorage.BINARY)
+
+
+def test_wkb_round_trip():
+    coordinates = generate_multipolygon(100, polygon_count=3)["geometry"]["coordinates"]
+    coordinates[1].append(coordinates[1][0][::-1])
+
+    wkb = arrays_to_wkb(multipolygon_to_arrays(coordinates))
+
+    assert wkb[:5] == b"\x01\x06\x00\x00\x00"
+    assert arrays_to_coordinates(wkb_to_arrays(wkb)) == coordinates
+
+
+def test_wkb_rejects_other_geometries():
+    with pytest.raises(GeometryError):
+        wkb_to_arrays(b"\x01\x03\x00\x00\x00\x00\x00\x00\x00")
+
+
+def test_binary_storage_keeps_feature_members():
+    area_of_interest = {
+        **SAMPLE_GEOJSON,
+        "properties": {"source": "survey"},
+        "geometry": {**SAMPLE_GEOJSON["geometry"], "bbox": [-53, -6, -52, -5]},
+    }
+
+    stored, wkb = encode_area_of_interest(area_of_interest, GeometryStorage.BINARY)
+
+    assert "coordinates" not in stored["geometry"]
+    assert len(wkb) < len(str(area_of_interest["geometry"]["coordinates"]))
+    assert decode_area_of_interest(stored, wkb) == area_of_interest
+
+
+def test_binary_storage_keeps_altitudes_in_json():
+    area_of_interest = {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {
+            "type": "MultiPolygon",
+            "coordinates": [[[[0, 0, 5], [1, 0, 5], [1, 1, 5], [0, 0, 5]]]],
+        },
+    }
+
+    assert encode_area_of_interest(area_of_interest, GeometryStorage.BINARY) == (
+        area_of_interest,
+        None,
+    )
+
+
+def test_create_project_with_binary_storage(client, test_db, binary_storage):
+    response = client.post(
+        "/api/projects/create",
+        json={
+            "name": "Binary Project",
+            "start_date": "2025-01-01",
+            "end_date": "2025-02-01",
+            "area_of_interest": SAMPLE_GEOJSON,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["area_of_interest"] == SAMPLE_GEOJSON
+    project = test_db.get(Project, response.json()["id"])
+    assert project.area_of_interest_wkb is not None
+    assert "coordinates" not in project.area_of_interest_json["geometry"]
+
+
+def test_migrate_geometry(test_db, test_async_sessionmaker, dummy_project):
+    projects = [
+        dummy_project(
+            name=f"Migrated {index}",
+            start_date="2025-01-01",
+            end_date="2025-02-01",
+            area_of_interest=SAMPLE_GEOJSON,
+        )
+        for index in range(3)
+    ]
+
+    def migrate(storage: GeometryStorage) -> int:
+        return asyncio.run(
+            migrate_geometry(storage, 2, test_async_sessionmaker, output=io.StringIO())
+        )
+
+    assert migrate(GeometryStorage.BINARY) == 3
+    assert migrate(GeometryStorage.BINARY) == 0
+    test_db.expire_all()
+    for project in projects:
+        assert project.area_of_interest_wkb is not None
+        assert project.area_of_interest == SAMPLE_GEOJSON
+
+    assert migrate(GeometryStorage.JSON) == 3
+    test_db.expire_all()
+    for project in projects:
+        assert project.area_of_interest_wkb is None
+        assert project.area_of_interest_json == SAMPLE_GEOJSON
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+import pytest
+
+from data.generators import generate_multipolygon
+from projects_manager.config.settings import get_settings
+from projects_manager.config.workers import WorkerPool, WorkerPoolKind
+from projects_manager.routers import projects
+
+
+@pytest.fixture(params=list(WorkerPoolKind))
+def offloading_pool(request, monkeypatch):
+    pool = WorkerPool(request.param, max_workers=1)
+    calls = []
+    run = pool.run
+
+    async def counting_run(function, *args):
+        calls.append(function)
+        return await run(function, *args)
+
+    monkeypatch.setattr(pool, "run", counting_run)
+    monkeypatch.setattr(projects.validated_create_body, "pool", pool)
+    monkeypatch.setattr(projects.validated_update_body, "pool", pool)
+    monkeypatch.setattr(get_settings(), "validation_offload_threshold", 1024)
+    yield calls
+    pool.shutdown()
+
+
+def _payload(name: str, vertex_count: int):
+    return {
+        "name": name,
+        "start_date": date.today().isoformat(),
+        "end_date": (date.today() + timedelta(days=30)).isoformat(),
+        "area_of_interest": generate_multipolygon(vertex_count),
+    }
+
+
+def test_large_payloads_are_validated_in_pool(client, offloading_pool):
+    payload = _payload("Large Project", 500)
+
+    response = client.post("/api/projects/create", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["area_of_interest"] == payload["area_of_interest"]
+    assert len(offloading_pool) == 1
+
+    response = client.patch(
+        f"/api/projects/update/{response.json()['id']}",
+        json={
+            "description": "Updated",
+            "area_of_interest": payload["area_of_interest"],
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["description"] == "Updated"
+    assert response.json()["name"] == "Large Project"
+    assert len(offloading_pool) == 2
+
+
+def test_small_payloads_are_validated_inline(client, offloading_pool):
+    response = client.post("/api/projects/create", json=_payload("Small Project", 10))
+
+    assert response.status_code == 200
+    assert offloading_pool == []
+
+
+def test_pool_validation_errors(client, offloading_pool):
+    payload = _payload("Invalid Project", 500)
+    payload["area_of_interest"]["geometry"]["coordinates"][0][0][0][0] = 200.0
+
+    response = client.post("/api/projects/create", json=payload)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == [
+        "body",
+        "area_of_interest",
+        "geometry",
+    ]
+    assert len(offloading_pool) == 1